@@ -0,0 +1,42 @@
+"""Fill uploaded_at server side.
+
+Revision ID: a91c8f27d504
+Revises: f7e52ab918c4
+Create Date: 2026-08-29 11:07:48.213907
+
+"""  # noqa: INP001
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a91c8f27d504"
+down_revision: Union[str, None] = "f7e52ab918c4"  # noqa: FA100
+branch_labels: Union[str, Sequence[str], None] = None  # noqa: FA100
+depends_on: Union[str, Sequence[str], None] = None  # noqa: FA100
+
+
+def upgrade() -> None:  # noqa: D103
+    for table in ("images", "documents"):
+        op.execute(
+            f"UPDATE {table} SET uploaded_at = now() "  # noqa: S608
+            f"WHERE uploaded_at IS NULL",
+        )
+        op.alter_column(
+            table,
+            "uploaded_at",
+            server_default=sa.func.now(),
+            nullable=False,
+        )
+
+
+def downgrade() -> None:  # noqa: D103
+    for table in ("images", "documents"):
+        op.alter_column(
+            table,
+            "uploaded_at",
+            server_default=None,
+            nullable=True,
+        )
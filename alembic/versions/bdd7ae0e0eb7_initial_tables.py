@@ -7,9 +7,9 @@ Create Date: 2024-07-07 14:55:44.169099
 """  # noqa: INP001
 from typing import Sequence, Union
 
-import sqlalchemy as sa  # noqa: F401
+import sqlalchemy as sa
 
-from alembic import op  # noqa: F401
+from alembic import op
 
 # revision identifiers, used by Alembic.
 revision: str = "bdd7ae0e0eb7"
@@ -19,12 +19,68 @@ depends_on: Union[str, Sequence[str], None] = None  # noqa: FA100
 
 
 def upgrade() -> None:  # noqa: D103
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    # Baseline schema as create_all() produced it; later revisions add
+    # the hot-path indexes, constraints and server defaults on top.
+    op.create_table(
+        "users",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("hashed_password", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+        sa.UniqueConstraint("email"),
+    )
+    op.create_index("ix_users_user_id", "users", ["user_id"])
+    op.create_table(
+        "images",
+        sa.Column("image_id", sa.Integer(), nullable=False),
+        sa.Column("s3_key", sa.String(), nullable=False),
+        sa.Column("image_name", sa.String(), nullable=False),
+        sa.Column("uploaded_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("image_id"),
+        sa.UniqueConstraint("s3_key"),
+    )
+    op.create_index("ix_images_image_id", "images", ["image_id"])
+    op.create_table(
+        "projects",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=True),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("logo_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.user_id"]),
+        sa.ForeignKeyConstraint(["logo_id"], ["images.image_id"]),
+        sa.PrimaryKeyConstraint("project_id"),
+        sa.UniqueConstraint("logo_id"),
+    )
+    op.create_index("ix_projects_project_id", "projects", ["project_id"])
+    op.create_table(
+        "documents",
+        sa.Column("document_id", sa.Integer(), nullable=False),
+        sa.Column("document_name", sa.String(length=255), nullable=False),
+        sa.Column("s3_key", sa.String(length=255), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.Column("uploaded_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.project_id"]),
+        sa.PrimaryKeyConstraint("document_id"),
+    )
+    op.create_index("ix_documents_document_id", "documents", ["document_id"])
+    op.create_table(
+        "participant_project",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.project_id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.user_id"]),
+        sa.PrimaryKeyConstraint("project_id", "user_id"),
+    )
 
 
 def downgrade() -> None:  # noqa: D103
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
+    op.drop_table("participant_project")
+    op.drop_index("ix_documents_document_id", table_name="documents")
+    op.drop_table("documents")
+    op.drop_index("ix_projects_project_id", table_name="projects")
+    op.drop_table("projects")
+    op.drop_index("ix_images_image_id", table_name="images")
+    op.drop_table("images")
+    op.drop_index("ix_users_user_id", table_name="users")
+    op.drop_table("users")
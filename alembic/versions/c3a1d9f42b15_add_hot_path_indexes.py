@@ -0,0 +1,37 @@
+"""Add hot path indexes.
+
+Revision ID: c3a1d9f42b15
+Revises: bdd7ae0e0eb7
+Create Date: 2026-08-29 10:12:03.551273
+
+"""  # noqa: INP001
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a1d9f42b15"
+down_revision: Union[str, None] = "bdd7ae0e0eb7"  # noqa: FA100
+branch_labels: Union[str, Sequence[str], None] = None  # noqa: FA100
+depends_on: Union[str, Sequence[str], None] = None  # noqa: FA100
+
+
+def upgrade() -> None:  # noqa: D103
+    op.create_index(
+        "ix_users_email", "users", ["email"], unique=True,
+    )
+    # The named unique index replaces the baseline UniqueConstraint;
+    # keeping both would maintain two identical btrees on every user
+    # write and diverge from the schema the models declare.
+    op.drop_constraint("users_email_key", "users", type_="unique")
+    op.create_index(
+        "ix_documents_project_id", "documents", ["project_id"],
+    )
+
+
+def downgrade() -> None:  # noqa: D103
+    op.drop_index("ix_documents_project_id", table_name="documents")
+    op.create_unique_constraint("users_email_key", "users", ["email"])
+    op.drop_index("ix_users_email", table_name="users")
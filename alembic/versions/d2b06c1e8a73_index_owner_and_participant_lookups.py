@@ -0,0 +1,34 @@
+"""Index owner and participant lookups.
+
+Revision ID: d2b06c1e8a73
+Revises: a91c8f27d504
+Create Date: 2026-08-29 11:18:26.480152
+
+"""  # noqa: INP001
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2b06c1e8a73"
+down_revision: Union[str, None] = "a91c8f27d504"  # noqa: FA100
+branch_labels: Union[str, Sequence[str], None] = None  # noqa: FA100
+depends_on: Union[str, Sequence[str], None] = None  # noqa: FA100
+
+
+def upgrade() -> None:  # noqa: D103
+    op.create_index(
+        "ix_projects_owner_id", "projects", ["owner_id"],
+    )
+    op.create_index(
+        "ix_participant_project_user_id", "participant_project", ["user_id"],
+    )
+
+
+def downgrade() -> None:  # noqa: D103
+    op.drop_index(
+        "ix_participant_project_user_id", table_name="participant_project",
+    )
+    op.drop_index("ix_projects_owner_id", table_name="projects")
@@ -0,0 +1,41 @@
+"""Cover participant reverse lookup.
+
+Revision ID: e58d34f0b6c2
+Revises: d2b06c1e8a73
+Create Date: 2026-08-29 11:52:30.774918
+
+"""  # noqa: INP001
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e58d34f0b6c2"
+down_revision: Union[str, None] = "d2b06c1e8a73"  # noqa: FA100
+branch_labels: Union[str, Sequence[str], None] = None  # noqa: FA100
+depends_on: Union[str, Sequence[str], None] = None  # noqa: FA100
+
+
+def upgrade() -> None:  # noqa: D103
+    # The composite index covers user-only lookups too, so the
+    # single-column index becomes redundant.
+    op.drop_index(
+        "ix_participant_project_user_id", table_name="participant_project",
+    )
+    op.create_index(
+        "ix_participant_project_user_project",
+        "participant_project",
+        ["user_id", "project_id"],
+    )
+
+
+def downgrade() -> None:  # noqa: D103
+    op.drop_index(
+        "ix_participant_project_user_project",
+        table_name="participant_project",
+    )
+    op.create_index(
+        "ix_participant_project_user_id", "participant_project", ["user_id"],
+    )
@@ -0,0 +1,32 @@
+"""Add unique document name per project.
+
+Revision ID: f7e52ab918c4
+Revises: c3a1d9f42b15
+Create Date: 2026-08-29 10:41:17.902644
+
+"""  # noqa: INP001
+from typing import Sequence, Union
+
+import sqlalchemy as sa  # noqa: F401
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7e52ab918c4"
+down_revision: Union[str, None] = "c3a1d9f42b15"  # noqa: FA100
+branch_labels: Union[str, Sequence[str], None] = None  # noqa: FA100
+depends_on: Union[str, Sequence[str], None] = None  # noqa: FA100
+
+
+def upgrade() -> None:  # noqa: D103
+    op.create_unique_constraint(
+        "uq_document_project_name",
+        "documents",
+        ["project_id", "document_name"],
+    )
+
+
+def downgrade() -> None:  # noqa: D103
+    op.drop_constraint(
+        "uq_document_project_name", "documents", type_="unique",
+    )
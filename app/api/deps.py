@@ -0,0 +1,36 @@
+"""Shared dependencies for API endpoints."""
+
+from __future__ import annotations
+
+from fastapi import Depends, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TCH002
+
+from app.crud.user import get_authenticated_user
+from app.db.session import get_db
+from app.models.project import User  # noqa: TCH001
+
+bearer = HTTPBearer(auto_error=True)
+
+
+async def current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(bearer),  # noqa: ARG001, B008
+    db: AsyncSession = Depends(get_db),  # noqa: B008
+) -> User:
+    """Resolve the authenticated user for the current request.
+
+    Args:
+    ----
+    request (Request): The incoming request.
+    credentials (HTTPAuthorizationCredentials, optional): The parsed
+    bearer credentials. Defaults to Depends(bearer).
+    db (AsyncSession, optional): AsyncSession dependency for
+    database operations. Defaults to Depends(get_db).
+
+    Returns:
+    -------
+    User: The authenticated user object.
+
+    """
+    return await get_authenticated_user(request, db)
@@ -2,77 +2,87 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.security import APIKeyHeader
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TCH002
 
+from app.api.deps import current_user
 from app.crud.project import (
     create_project,
     get_projects,
 )
-from app.crud.user import get_authenticated_user
 from app.db.session import get_db
-from app.models.project import Project  # noqa: TCH001
+from app.models.project import Project, User  # noqa: TCH001
 from app.schemas.project import (
+    PROJECTS_ADAPTER,
+    PROJECTS_WITH_DOCUMENTS_ADAPTER,
     ProjectBase,
     ProjectOut,
     ProjectOutWithDocuments,
 )
 
 router = APIRouter()
-auth_header1 = APIKeyHeader(name="Authorization", scheme_name="Bearer")
 
 
-@router.get("/", response_model=list[ProjectOutWithDocuments])
+@router.get(
+    "/",
+    response_model=list[ProjectOut] | list[ProjectOutWithDocuments],
+)
 async def read_projects(
-    request: Request,
-    header_value1: str = Depends(auth_header1),  # noqa: ARG001
+    include: set[str] = Query(default=set()),  # noqa: B008
     db: AsyncSession = Depends(get_db),  # noqa: B008
-) -> list[ProjectOutWithDocuments]:
-    """Retrieve all projects with associated documents.
+    user_obj: User = Depends(current_user),  # noqa: B008
+) -> list[ProjectOut] | list[ProjectOutWithDocuments]:
+    """Retrieve all projects for the authenticated user.
 
     Args:
     ----
-    request (Request): The incoming request.
-    header_value1 (str, optional): Header value for authentication.
-    Defaults to Depends(auth_header1).
+    include (set[str], optional): Extra relations to embed in the
+    response; pass include=documents to attach each project's
+    documents. Defaults to none.
     db (AsyncSession, optional): AsyncSession dependency for database
     operations.
     Defaults to Depends(get_db).
+    user_obj (User, optional): The authenticated user.
+    Defaults to Depends(current_user).
 
     Returns:
     -------
-    list[ProjectOutWithDocuments]: A list of projects
-    with associated documents.
+    list[ProjectOut] | list[ProjectOutWithDocuments]: The user's
+    projects, with documents only when requested.
 
     """
-    user_obj = await get_authenticated_user(request, db)
-    return await get_projects(db, user_obj)
+    with_documents = "documents" in include
+    projects = await get_projects(
+        db, user_obj, include_documents=with_documents,
+    )
+    # Convert the whole list in one pydantic-core pass rather than one
+    # ORM object at a time.
+    adapter = (
+        PROJECTS_WITH_DOCUMENTS_ADAPTER if with_documents else PROJECTS_ADAPTER
+    )
+    return adapter.validate_python(projects, from_attributes=True)
 
 
 @router.post("/", response_model=ProjectOut)
 async def write_project(
     project: ProjectBase,
-    request: Request,
-    header_value1: str = Depends(auth_header1),  # noqa: ARG001
     db: AsyncSession = Depends(get_db),  # noqa: B008
+    user_obj: User = Depends(current_user),  # noqa: B008
 ) -> Project:
     """Create a new project.
 
     Args:
     ----
     project (ProjectBase): Data to create a new project.
-    request (Request): The incoming request.
-    header_value1 (str, optional): Header value for authentication.
-    Defaults to Depends(auth_header1).
     db (AsyncSession, optional): AsyncSession dependency for
     database operations.
     Defaults to Depends(get_db).
+    user_obj (User, optional): The authenticated user.
+    Defaults to Depends(current_user).
 
     Returns:
     -------
     Project: The newly created project.
 
     """
-    user_obj = await get_authenticated_user(request, db)
     return await create_project(db, project, user_obj)
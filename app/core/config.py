@@ -1,17 +1,34 @@
 """Configuration settings."""
 
-import os
+from __future__ import annotations
 
-from dotenv import load_dotenv
+from functools import lru_cache
 
-load_dotenv()
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
-JWT_REFRESH_SECRET_KEY = os.getenv("JWT_REFRESH_SECRET_KEY")
-ACCESS_TOKEN_EXPIRE_MINUTES = 60
-REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7
-ALGORITHM = "HS256"
-BUCKET_NAME = os.getenv("S3_BUCKET_1")
-BUCKET_NAME_LOGOS = os.getenv("S3_BUCKET_2")
-BUCKET_RESIZE = os.getenv("S3_BUCKET_3")
+
+class Settings(BaseSettings):
+    """Application settings parsed once from the environment."""
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    DATABASE_URL: str | None = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    JWT_SECRET_KEY: str | None = None
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    ALGORITHM: str = "HS256"
+    BUCKET_NAME: str | None = Field(None, validation_alias="S3_BUCKET_1")
+    BUCKET_NAME_LOGOS: str | None = Field(None, validation_alias="S3_BUCKET_2")
+    BUCKET_RESIZE: str | None = Field(None, validation_alias="S3_BUCKET_3")
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the application settings, constructed on first use."""
+    return Settings()
+
+
+settings = get_settings()
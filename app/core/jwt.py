@@ -2,30 +2,33 @@
 
 from __future__ import annotations
 
-import os
-from datetime import datetime, timedelta, timezone
+import time
 from typing import Any
 
-from dotenv import load_dotenv
-from jose import jwt
+import jwt
 
-load_dotenv()
+from app.core.config import settings
 
-ACCESS_TOKEN_EXPIRE_MINUTES = 60  # 60 minutes
-REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
-ALGORITHM = "HS256"
-JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
+# Sourced from the cached Settings object so the JWT configuration is
+# parsed from the environment exactly once, alongside the rest of the
+# app's settings.
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+ALGORITHM = settings.ALGORITHM
+JWT_SECRET_KEY = settings.JWT_SECRET_KEY
+# Encoded once at import; PyJWT would otherwise re-encode the str
+# secret into key bytes on every token issued.
+_KEY_BYTES = JWT_SECRET_KEY.encode() if JWT_SECRET_KEY else None
 
 
 def create_access_token(
     subject: str | Any, expires_delta: int | None = None,  # noqa: ANN401
 ) -> str:
     """Create an access token."""
+    # PyJWT serializes exp to unix seconds anyway; computing it as an
+    # int directly skips the datetime/timedelta objects per token.
     if expires_delta is not None:
-        expires_delta = datetime.now(timezone.utc) + expires_delta
+        exp = int(time.time()) + expires_delta
     else:
-        expires_delta = datetime.now(timezone.utc) + timedelta(
-            minutes=ACCESS_TOKEN_EXPIRE_MINUTES,
-        )
-    to_encode = {"exp": expires_delta, "sub": str(subject)}
-    return jwt.encode(to_encode, JWT_SECRET_KEY, ALGORITHM)
+        exp = int(time.time()) + ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    to_encode = {"exp": exp, "sub": str(subject)}
+    return jwt.encode(to_encode, _KEY_BYTES, algorithm=ALGORITHM)
@@ -1,15 +1,69 @@
 """Security utilities."""
 
-from passlib.context import CryptContext
+import asyncio
+import hmac
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
+from cachetools import TTLCache
+
+BCRYPT_ROUNDS = 12
+
+VERIFY_CACHE_SIZE = 4096
+VERIFY_CACHE_TTL = 60
+
+# bcrypt deliberately takes tens of milliseconds; run it in a dedicated
+# thread pool so concurrent requests aren't blocked on the event loop.
+hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Remembers recent successful verifications so a client re-sending the
+# same credentials within the TTL skips the full bcrypt key schedule.
+# Keys are HMACs of the plaintext under the stored hash (which embeds
+# the salt), so the cache never holds anything usable offline.
+_verify_cache: TTLCache = TTLCache(
+    maxsize=VERIFY_CACHE_SIZE, ttl=VERIFY_CACHE_TTL,
+)
+# TTLCache is not thread-safe and verification runs on executor threads.
+_verify_cache_lock = threading.Lock()
 
 
 def get_hashed_password(password: str) -> str:
     """Hashes a plain text password."""
-    return password_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS),
+    ).decode()
 
 
 def verify_password(password: str, hashed_pass: str) -> bool:
     """Verify a plain text password against a hashed password."""
-    return password_context.verify(password, hashed_pass)
+    cache_key = hmac.new(
+        hashed_pass.encode(), password.encode(), "sha256",
+    ).digest()
+    with _verify_cache_lock:
+        cached = _verify_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = bcrypt.checkpw(password.encode(), hashed_pass.encode())
+    # Only successful checks are cached: a wrong password must keep
+    # paying full bcrypt cost so the cache can't speed up guessing.
+    if result:
+        with _verify_cache_lock:
+            _verify_cache[cache_key] = True
+    return result
+
+
+async def get_hashed_password_async(password: str) -> str:
+    """Hash a plain text password without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        hash_executor, get_hashed_password, password,
+    )
+
+
+async def verify_password_async(password: str, hashed_pass: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        hash_executor, verify_password, password, hashed_pass,
+    )
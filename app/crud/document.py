@@ -3,18 +3,18 @@
 from __future__ import annotations
 
 from fastapi import HTTPException, Response, UploadFile
-from sqlalchemy import event, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, literal, select
+from sqlalchemy.engine import Row  # noqa: TCH002
 from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TCH002
-from sqlalchemy.orm import selectinload
 
-from app.core.config import BUCKET_NAME
-from app.crud.project import get_documents, is_participant
-from app.db.buckets import delete_from_s3, download_from_s3, upload_to_s3
-from app.db.session import SessionLocal
+from app.core.config import settings
+from app.db.buckets import delete_from_s3, stream_from_s3, upload_to_s3
 from app.models.project import (
     Document,
     Project,
     User,
+    participant_project,
 )
 from app.schemas.project import DocumentOut
 
@@ -23,7 +23,7 @@ async def get_document(
     db: AsyncSession,
     document_id: int,
     user_obj: User,
-) -> Document:
+) -> Row:
     """Retrieve document information by document ID.
 
     Args:
@@ -34,7 +34,8 @@ async def get_document(
 
     Returns:
     -------
-        Document: The document object if authorized.
+        Row: A row with the document_id, document_name and s3_key
+        columns of the document if authorized.
 
     Raises:
     ------
@@ -42,29 +43,39 @@ async def get_document(
             is not authorized.
 
     """
-    async with db.begin():
-        # Retrieve the document by document_id
-        document = await db.execute(
-            select(Document)
-            .where(Document.document_id == document_id)
-            .options(selectinload(Document.project)),
+    # Fetch only the columns the callers read, the owning project's
+    # owner_id and the participant check in a single round trip,
+    # skipping ORM entity hydration entirely.
+    participant_exists = (
+        select(literal(True))  # noqa: FBT003
+        .where(
+            participant_project.c.user_id == user_obj.user_id,
+            participant_project.c.project_id == Document.project_id,
         )
-        document = document.scalars().first()
-        if not document:
-            raise HTTPException(status_code=404, detail="Document not found")
-
-        project = document.project
-        if user_obj.user_id == project.owner_id or await is_participant(
-            user_obj.user_id,
-            project.project_id,
-            db,
-        ):
-            return document
-
-        raise HTTPException(
-            status_code=403,
-            detail="User is not authorized for this document's project",
+        .exists()
+    )
+    result = await db.execute(
+        select(
+            Document.document_id,
+            Document.document_name,
+            Document.s3_key,
+            Project.owner_id,
+            participant_exists.label("is_participant"),
         )
+        .join(Project, Document.project_id == Project.project_id)
+        .where(Document.document_id == document_id),
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    if user_obj.user_id == row.owner_id or row.is_participant:
+        return row
+
+    raise HTTPException(
+        status_code=403,
+        detail="User is not authorized for this document's project",
+    )
 
 
 async def update_document(
@@ -96,7 +107,7 @@ async def update_document(
 
     s3_key = await upload_to_s3(
         file,
-        BUCKET_NAME,
+        settings.BUCKET_NAME,
         s3_key=document.s3_key,
     )
     if not s3_key:
@@ -104,7 +115,6 @@ async def update_document(
             status_code=500,
             detail="Failed to upload to S3",
         )
-    document.s3_key = s3_key
     return DocumentOut(
         document_id=document.document_id,
         document_name=document.document_name,
@@ -135,14 +145,16 @@ async def delete_document(
 
     """
     document = await get_document(db, document_id, user_obj)
-    success = await delete_from_s3(BUCKET_NAME, document.s3_key)
+    success = await delete_from_s3(settings.BUCKET_NAME, document.s3_key)
     if not success:
         raise HTTPException(
             status_code=500,
             detail="Failed to delete from S3",
         )
-    async with db.begin():
-        await db.delete(document)
+    await db.execute(
+        delete(Document).where(Document.document_id == document_id),
+    )
+    await db.commit()
     return {"message": "Document deleted successfully"}
 
 
@@ -170,53 +182,26 @@ async def download_document(
     """  # noqa: D407
     document = await get_document(db, document_id, user_obj)
 
-    # Download document content from S3
-    document_content = await download_from_s3(
-        BUCKET_NAME,
+    # Stream document content from S3 so the full payload is never
+    # buffered in memory.
+    document_stream = await stream_from_s3(
+        settings.BUCKET_NAME,
         document.s3_key,
     )
-    if document_content is None:
+    if document_stream is None:
         raise HTTPException(
             status_code=500,
             detail="Failed to download document from S3",
         )
 
-    return Response(
-        content=document_content,
+    return StreamingResponse(
+        document_stream,
+        media_type="application/octet-stream",
         headers={
             "Content-Disposition": (
                 f"attachment;filename={document.document_name}"
             ),
-            "Content-Type": "application/octet-stream",
         },
     )
 
 
-async def delete_documents_from_s3(target: Project) -> None:
-    """Event listener to delete documents associated with a Project from S3
-    after deletion of the Project.
-
-    Args:
-    ----
-        mapper: SQLAlchemy mapper.
-        connection: SQLAlchemy connection object.
-        target: The instance of Project being deleted.
-
-    Returns:
-    -------
-        None
-
-    Raises:
-    ------
-        Any exceptions raised by get_documents or delete_from_s3 functions.
-
-    """  # noqa: D205
-    async with SessionLocal() as session:
-        documents = await get_documents(
-            db=session, project_id=target.project_id,
-        )
-        for document in documents:
-            await delete_from_s3(BUCKET_NAME, document.s3_key)
-
-
-event.listen(Project, "after_delete", delete_documents_from_s3)
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from fastapi import HTTPException, Response, UploadFile
-from sqlalchemy import event, insert
+import asyncio
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy import lambda_stmt, literal, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row  # noqa: TCH002
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TCH002
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, noload
 
-from app.core.config import BUCKET_NAME, BUCKET_NAME_LOGOS, BUCKET_RESIZE
-from app.db.buckets import delete_from_s3, download_from_s3, upload_to_s3
+from app.core.config import settings
+from app.db.buckets import delete_from_s3, stream_from_s3, upload_to_s3
 from app.models.project import (
     Document,
     Image,
@@ -19,7 +25,12 @@ from app.models.project import (
 )
 from app.schemas.document import DocumentName
 from app.schemas.image import LogoOut
-from app.schemas.project import DocumentOut, ProjectBase, ProjectBaseUpdate
+from app.schemas.project import (
+    DOCUMENTS_ADAPTER,
+    DocumentOut,
+    ProjectBase,
+    ProjectBaseUpdate,
+)
 
 
 async def is_participant(
@@ -41,12 +52,20 @@ async def is_participant(
               False otherwise.
 
     """
-    participant_query = select(participant_project).where(
-        participant_project.c.user_id == user_id,
-        participant_project.c.project_id == project_id,
+    # EXISTS lets Postgres stop at the first matching row instead of
+    # materialising the association row; lambda_stmt reuses the
+    # compiled statement between calls.
+    participant_query = lambda_stmt(
+        lambda: select(literal(True))  # noqa: FBT003
+        .where(
+            participant_project.c.user_id == user_id,
+            participant_project.c.project_id == project_id,
+        )
+        .exists()
+        .select(),
     )
     result = await session.execute(participant_query)
-    return result.scalar_one_or_none() is not None
+    return bool(result.scalar())
 
 
 async def create_project(
@@ -67,15 +86,16 @@ async def create_project(
         Project: The created project object.
 
     """
-    async with db.begin():
-        db_project = Project(
-            name=project.name,
-            description=project.description,
-            owner_id=user_obj.user_id,
-        )
-        db.add(db_project)
+    db_project = Project(
+        name=project.name,
+        description=project.description,
+        owner_id=user_obj.user_id,
+    )
+    db.add(db_project)
+    await db.commit()
 
-    await db.refresh(db_project)
+    # expire_on_commit=False keeps the instance populated after the
+    # commit, so no refresh round trip is needed.
     return db_project
 
 
@@ -102,22 +122,93 @@ async def get_project(
                       is not authorized
 
     """
-    async with db.begin():
-        db_project = await db.get(Project, project_id)
-        if db_project is None:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        if user_obj.user_id == db_project.owner_id or await is_participant(
-            user_obj.user_id,
-            project_id,
-            db,
-        ):
-            return db_project
+    user_id = user_obj.user_id
+    # Fetch the project and the participant check in one round trip
+    # instead of db.get followed by an is_participant query; the
+    # lambda keeps the compiled statement cached across requests.
+    # noload stops the selectin default from fetching the documents
+    # nobody reads on this path.
+    result = await db.execute(
+        lambda_stmt(
+            lambda: select(
+                Project,
+                select(literal(True))  # noqa: FBT003
+                .where(
+                    participant_project.c.user_id == user_id,
+                    participant_project.c.project_id
+                    == Project.project_id,
+                )
+                .exists(),
+            )
+            .options(noload(Project.documents))
+            .where(Project.project_id == project_id),
+        ),
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Project not found")
 
-        raise HTTPException(
-            status_code=403,
-            detail="User is not authorized for this project",
+    db_project, is_member = row
+    if user_obj.user_id == db_project.owner_id or is_member:
+        return db_project
+
+    raise HTTPException(
+        status_code=403,
+        detail="User is not authorized for this project",
+    )
+
+
+async def get_project_with_logo(
+    db: AsyncSession,
+    project_id: int,
+    user_obj: User,
+) -> Project:
+    """Retrieve a project with its logo eagerly loaded.
+
+    Args:
+    ----
+        db (AsyncSession): The asynchronous database session.
+        project_id (int): The ID of the project to retrieve.
+        user_obj (User): The authenticated user object.
+
+    Returns:
+    -------
+        Project: The project object, with the logo relationship
+        populated, if the user is authorized.
+
+    Raises:
+    ------
+        HTTPException: If the project is not found or the user
+                      is not authorized
+
+    """
+    # The logo is always exactly one row, so joining it here saves the
+    # separate get_image query the logo handlers used to issue.
+    participant_exists = (
+        select(literal(True))  # noqa: FBT003
+        .where(
+            participant_project.c.user_id == user_obj.user_id,
+            participant_project.c.project_id == Project.project_id,
         )
+        .exists()
+    )
+    result = await db.execute(
+        select(Project, participant_exists)
+        .options(joinedload(Project.logo), noload(Project.documents))
+        .where(Project.project_id == project_id),
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    db_project, is_member = row
+    if user_obj.user_id == db_project.owner_id or is_member:
+        return db_project
+
+    raise HTTPException(
+        status_code=403,
+        detail="User is not authorized for this project",
+    )
 
 
 async def update_project(
@@ -142,13 +233,12 @@ async def update_project(
     """
     # get_project will check if user is authorized
     db_project = await get_project(db, project_id, user_obj)
-    async with db.begin():
-        if project_data.name is not None:
-            db_project.name = project_data.name
-        if project_data.description is not None:
-            db_project.description = project_data.description
+    # exclude_unset limits the flush to fields the client actually
+    # sent, so the UPDATE never rewrites untouched columns.
+    for field, value in project_data.model_dump(exclude_unset=True).items():
+        setattr(db_project, field, value)
+    await db.commit()
 
-    await db.refresh(db_project)
     return db_project
 
 
@@ -176,28 +266,61 @@ async def delete_project(
     """
     # get_project will check if user is authorized
     db_project = await get_project(db, project_id, user_obj)
-    async with db.begin():
-        if user_obj.user_id == db_project.owner_id:
-            await db.delete(db_project)
-            return {"message": "Project deleted successfully"}
-
+    if user_obj.user_id != db_project.owner_id:
         raise HTTPException(
             status_code=403,
             detail="User is not authorized for this project",
         )
 
+    # Collect the S3 keys before the rows cascade away; the objects
+    # are removed only after the commit, so a failed transaction never
+    # deletes objects whose rows survived.
+    result = await db.execute(
+        select(Document.s3_key).where(Document.project_id == project_id),
+    )
+    cleanup = [(settings.BUCKET_NAME, s3_key) for s3_key in result.scalars()]
+
+    # The logo lives in two buckets: the original under the project
+    # prefix and the resized copy under its own key, as in delete_logo.
+    logo = db_project.logo
+    if logo is not None:
+        cleanup.append(
+            (
+                settings.BUCKET_NAME_LOGOS,
+                str(project_id) + "/" + logo.image_name,
+            ),
+        )
+        cleanup.append((settings.BUCKET_RESIZE, logo.s3_key))
+
+    await db.delete(db_project)
+    await db.commit()
+
+    # Each delete is an independent HTTPS round-trip, so issue them
+    # concurrently instead of one at a time.
+    await asyncio.gather(
+        *[delete_from_s3(bucket, s3_key) for bucket, s3_key in cleanup],
+    )
+    return {"message": "Project deleted successfully"}
 
-async def get_projects(db: AsyncSession, user_obj: User) -> list[Project]:
+
+async def get_projects(
+    db: AsyncSession,
+    user_obj: User,
+    *,
+    include_documents: bool = False,
+) -> list[Project]:
     """Retrieve projects associated with the authenticated user.
 
     Args:
     ----
         db (AsyncSession): The asynchronous database session.
         user_obj (User): The authenticated user object.
+        include_documents (bool): Whether to eagerly load each
+        project's documents. Defaults to False.
 
     Returns:
     -------
-        List[ProjectOutWithDocuments]: A list of project objects associated
+        List[Project]: A list of project objects associated
         with the authenticated user.
 
     Raises:
@@ -205,33 +328,36 @@ async def get_projects(db: AsyncSession, user_obj: User) -> list[Project]:
         HTTPException: If the user is not authenticated.
 
     """
-    async with db.begin():
-        owner_projects_query = (
-            select(Project)
-            .options(selectinload(Project.documents))
-            .where(Project.owner_id == user_obj.user_id)
+    # Only join the child rows when the caller asked for them;
+    # a plain listing shouldn't pay for every document row.
+    # The documents list per project is small, so a single JOIN
+    # beats the extra selectinload round trip when it is wanted.
+    options = (
+        joinedload(Project.documents)
+        if include_documents
+        else noload(Project.documents)
+    )
+    # One query covers both owned and participated projects;
+    # Postgres dedups via DISTINCT instead of Python.
+    user_projects_query = (
+        select(Project)
+        .options(options)
+        .outerjoin(
+            participant_project,
+            Project.project_id == participant_project.c.project_id,
         )
-        owner_results = await db.execute(owner_projects_query)
-        owner_projects = owner_results.scalars().all()
-
-        participant_projects_query = (
-            select(Project)
-            .join(
-                participant_project,
-                Project.project_id == participant_project.c.project_id,
-            )
-            .where(participant_project.c.user_id == user_obj.user_id)
-            .options(selectinload(Project.documents))
+        .where(
+            or_(
+                Project.owner_id == user_obj.user_id,
+                participant_project.c.user_id == user_obj.user_id,
+            ),
         )
-        participant_results = await db.execute(participant_projects_query)
-        participant_projects = participant_results.scalars().all()
-
-        user_projects = {
-            project.project_id: project
-            for project in owner_projects + participant_projects
-        }
+        .distinct()
+    )
+    results = await db.execute(user_projects_query)
+    user_projects = results.scalars().unique().all()
 
-    return list(user_projects.values())
+    return list(user_projects)
 
 
 async def invite(
@@ -259,46 +385,45 @@ async def invite(
                        or the invited user does not exist.
 
     """
-    current_user_email = user_obj.email
     project = await get_project(db, project_id, user_obj)
 
-    async with db.begin():
-        user = await db.execute(
-            select(User).filter(User.user_id == project.owner_id),
+    # The owner's email is already on user_obj, so ownership reduces to
+    # an id comparison instead of another User SELECT.
+    if project.owner_id != user_obj.user_id:
+        raise HTTPException(
+            status_code=403,
+            detail="Only the project owner can invite users",
         )
-        owner = user.scalar()
 
-        if owner.email != current_user_email:
-            raise HTTPException(
-                status_code=403,
-                detail="Only the project owner can invite users",
-            )
+    invited_user_result = await db.execute(
+        select(User.user_id).where(User.email == user_email).limit(1),
+    )
+    invited_user_id = invited_user_result.scalar_one_or_none()
 
-        invited_user_result = await db.execute(
-            select(User).filter(User.email == user_email),
+    if invited_user_id is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Invited user doesn't exist",
         )
-        invited_user_obj = invited_user_result.scalar()
-
-        if not invited_user_obj:
-            raise HTTPException(
-                status_code=404,
-                detail="Invited user doesn't exist",
-            )
-
-        if await is_participant(invited_user_obj.user_id, project_id, db):
-            raise HTTPException(
-                status_code=400,
-                detail="User is already participating in the project",
-            )
 
-        await db.execute(
-            insert(participant_project).values(
-                project_id=project_id,
-                user_id=invited_user_obj.user_id,
-            ),
+    # ON CONFLICT DO NOTHING folds the "already participating"
+    # check into the insert itself.
+    result = await db.execute(
+        insert(participant_project)
+        .values(
+            project_id=project_id,
+            user_id=invited_user_id,
+        )
+        .on_conflict_do_nothing(),
+    )
+    if result.rowcount == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="User is already participating in the project",
         )
 
-        return {"message": "Participant added to project successfully"}
+    await db.commit()
+    return {"message": "Participant added to project successfully"}
 
 
 async def upload_documents(
@@ -329,51 +454,83 @@ async def upload_documents(
     """
     project = await get_project(db, project_id, user_obj)
 
-    async with db.begin():  # Begin a new transaction
-        documents_out = []
-        for file in files:
-            # Check if the document with the same name already exists
-            existing_document = await db.execute(
-                select(Document).filter_by(
-                    document_name=file.filename,
-                    project_id=project.project_id,
-                ),
-            )
-            existing_document = existing_document.scalars().first()
-
-            if existing_document:
-                # Throw an exception if the document already exists
-                raise HTTPException(
-                    status_code=400,
-                    detail=(
-                        f"Document with name '{file.filename}' "
-                        f"already exists in the project."
-                    ),
-                )
+    # Reject duplicates before any S3 write: the object key is derived
+    # from the name, so uploading first would overwrite the existing
+    # document's object even when the insert is then refused.
+    filenames = [file.filename for file in files]
+    existing = await db.execute(
+        select(Document.document_name).where(
+            Document.project_id == project_id,
+            Document.document_name.in_(filenames),
+        ),
+    )
+    if existing.first() is not None:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "A document with one of these names "
+                "already exists in the project."
+            ),
+        )
+
+    # Upload concurrently with bounded parallelism.
+    semaphore = asyncio.Semaphore(8)
 
-            s3_key = await upload_to_s3(
+    async def upload(file: UploadFile) -> str | None:
+        async with semaphore:
+            return await upload_to_s3(
                 file,
-                BUCKET_NAME,
+                settings.BUCKET_NAME,
                 s3_key=str(project_id) + "/" + file.filename,
             )
-            if not s3_key:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to upload to S3",
-                )
-            document = Document(
+
+    s3_keys = await asyncio.gather(*[upload(file) for file in files])
+
+    if not all(s3_keys):
+        # Don't leave the successful uploads orphaned in the bucket.
+        await asyncio.gather(
+            *[
+                delete_from_s3(settings.BUCKET_NAME, s3_key)
+                for s3_key in s3_keys
+                if s3_key
+            ],
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to upload to S3",
+        )
+
+    documents_out = []
+    documents = []
+    for file, s3_key in zip(files, s3_keys):
+        documents.append(
+            Document(
                 document_name=file.filename,
                 s3_key=s3_key,
                 project_id=project.project_id,
-            )
-            db.add(document)
-
-            documents_out.append(
-                DocumentName(
-                    document_name=document.document_name,
-                ),
-            )
-        await db.commit()  # Commit the transaction
+            ),
+        )
+        documents_out.append(
+            DocumentName(
+                document_name=file.filename,
+            ),
+        )
+    db.add_all(documents)
+    # The UNIQUE(project_id, document_name) constraint backs up the
+    # pre-check against a concurrent duplicate. No S3 cleanup here: a
+    # racing duplicate means the object was already overwritten, and
+    # deleting it would break the surviving row's downloads too.
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "A document with one of these names "
+                "already exists in the project."
+            ),
+        ) from None
 
     return documents_out
 
@@ -382,7 +539,7 @@ async def get_documents(
     db: AsyncSession,
     project_id: int,
     user_obj: User | None = None,
-) -> list[Document] | list[DocumentOut]:
+) -> list[Row] | list[DocumentOut]:
     """Retrieve documents associated with a specified project.
 
     Args:
@@ -397,11 +554,14 @@ async def get_documents(
                            the documents associated with the project.
 
     """
-    async with db.begin():
-        result = await db.execute(
-            select(Document).where(Document.project_id == project_id),
-        )
-        documents = result.scalars().all()
+    # Only the id and name leave this function, so skip hydrating
+    # full Document instances.
+    result = await db.execute(
+        select(Document.document_id, Document.document_name).where(
+            Document.project_id == project_id,
+        ),
+    )
+    documents = result.all()
 
     if not user_obj:
         return documents
@@ -409,13 +569,11 @@ async def get_documents(
     #checking autorization
     await get_project(db, project_id, user_obj)
 
-    return [
-        DocumentOut(
-            document_id=document.document_id,
-            document_name=document.document_name,
-        )
-        for document in documents
-    ]
+    # One pydantic-core pass over the whole list instead of one model
+    # construction per row.
+    return DOCUMENTS_ADAPTER.validate_python(
+        documents, from_attributes=True,
+    )
 
 
 async def get_image(db: AsyncSession, image_id: int) -> Image:
@@ -436,22 +594,21 @@ async def get_image(db: AsyncSession, image_id: int) -> Image:
         HTTPException: If the image is not found or the user is not authorized.
 
     """
-    async with db.begin():
-        result = await db.execute(
-            select(Image).where(Image.image_id == image_id),
-        )
-        db_image = result.scalars().first()
-        if db_image is None:
-            raise HTTPException(status_code=404, detail="Image not found")
+    result = await db.execute(
+        select(Image).where(Image.image_id == image_id),
+    )
+    db_image = result.scalars().first()
+    if db_image is None:
+        raise HTTPException(status_code=404, detail="Image not found")
 
-        return db_image
+    return db_image
 
 
 async def download_logo(
     project_id: int,
     db: AsyncSession,
     user_obj: User,
-) -> Response:
+) -> StreamingResponse:
     """Download project logo.
 
     Args:
@@ -462,7 +619,7 @@ async def download_logo(
 
     Returns:
     -------
-        Response: The HTTP response containing the downloaded logo.
+        StreamingResponse: The HTTP response streaming the logo.
 
     Raises:
     ------
@@ -470,22 +627,24 @@ async def download_logo(
                        an issue with downloading the logo.
 
     """
-    #check if user is authorized
-    project = await get_project(db, project_id, user_obj)
-    logo = await get_image(db, project.logo_id)
-    #download resized image
-    logo_content = await download_from_s3(BUCKET_RESIZE, logo.s3_key)
-    if not logo_content:
+    #check if user is authorized; the logo arrives in the same query
+    project = await get_project_with_logo(db, project_id, user_obj)
+    logo = project.logo
+    if logo is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    #stream resized image so it is never fully buffered in memory
+    logo_stream = await stream_from_s3(settings.BUCKET_RESIZE, logo.s3_key)
+    if logo_stream is None:
         raise HTTPException(
             status_code=500,
             detail="Failed to download logo from S3",
         )
 
-    return Response(
-        content=logo_content,
+    return StreamingResponse(
+        logo_stream,
+        media_type="image/jpeg",
         headers={
             "Content-Disposition": f"attachment;filename={logo.image_name}",
-            "Content-Type": "image/jpeg",
         },
     )
 
@@ -515,18 +674,15 @@ async def upload_logo(
         not authorized to upload the logo.
 
     """
-    #check if user is authorized
-    project = await get_project(db, project_id, user_obj)
+    #check if user is authorized; the logo arrives in the same query
+    project = await get_project_with_logo(db, project_id, user_obj)
     #if logo already exists delete it and then add new one
-    try:
-        logo = await get_image(db, project.logo_id)
+    if project.logo is not None:
         await delete_logo(project_id, db, user_obj)
-    except HTTPException:
-        pass
 
     s3_key = await upload_to_s3(
             file,
-            BUCKET_NAME_LOGOS,
+            settings.BUCKET_NAME_LOGOS,
             s3_key=str(project_id) + "/" + file.filename,
                 doc_type="image",
         )
@@ -536,14 +692,13 @@ async def upload_logo(
             detail="Failed to upload logo to S3",
         )
 
-    async with db.begin():
-
-        logo = Image(
-            s3_key=s3_key,
-            image_name=file.filename,
-            project=project,
-        )
-        db.add(logo)
+    logo = Image(
+        s3_key=s3_key,
+        image_name=file.filename,
+        project=project,
+    )
+    db.add(logo)
+    await db.commit()
 
     return LogoOut(image_id=logo.image_id, image_name=logo.image_name)
 
@@ -571,45 +726,26 @@ async def delete_logo(
                        an issue with deleting the logo.
 
     """
-    project = await get_project(db, project_id, user_obj)
-    logo = await get_image(db, project.logo_id)
+    project = await get_project_with_logo(db, project_id, user_obj)
+    logo = project.logo
+    if logo is None:
+        raise HTTPException(status_code=404, detail="Image not found")
     #delete from bucket where are images of orignal size
     #and where images are resized
-    success = await delete_from_s3(
-            BUCKET_NAME_LOGOS,
+    success, success_resize = await asyncio.gather(
+        delete_from_s3(
+            settings.BUCKET_NAME_LOGOS,
             str(project_id) + "/" + logo.image_name,
-        )
-    success_resize = await delete_from_s3(BUCKET_RESIZE, logo.s3_key)
+        ),
+        delete_from_s3(settings.BUCKET_RESIZE, logo.s3_key),
+    )
     if not (success and success_resize):
         raise HTTPException(
             status_code=500,
             detail="Failed to delete logo from S3",
         )
-    async with db.begin():
-        await db.delete(logo)
+    await db.delete(logo)
+    await db.commit()
     return {"message": "Logo deleted successfully"}
 
 
-async def delete_images_from_s3(target:Image) -> None:
-    """Event listener to delete images associated with a Project from S3 after
-    deletion of the Project.
-
-    Args:
-    ----
-        target (Image): The Image object associated with the Project
-          being deleted.
-
-    Notes:
-    -----
-        This function listens to the 'after_delete' event on the Project model.
-        If the Project's
-        associated Image has a logo, it deletes the logo from two S3 buckets:
-        BUCKET_NAME_LOGOS
-        and BUCKET_RESIZE.
-
-    """  # noqa: D205
-    if target.logo:
-        await delete_from_s3(BUCKET_NAME_LOGOS, target.logo.s3_key)
-        await delete_from_s3(BUCKET_RESIZE, target.logo.s3_key)
-
-event.listen(Project, "after_delete", delete_images_from_s3)
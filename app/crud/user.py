@@ -1,17 +1,30 @@
 """CRUD operations for users."""
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import lambda_stmt
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.core.jwt import create_access_token
-from app.core.security import get_hashed_password, verify_password
+from app.core.security import (
+    get_hashed_password_async,
+    verify_password_async,
+)
 from app.db.session import get_db
 from app.models.project import User
 from app.schemas.token import TokenSchema
 from app.schemas.user import UserAuth, UserOut
 
+USER_CACHE_SIZE = 10_000
+USER_CACHE_TTL = 30
+
+# Maps email -> (user_id, email) for recently authenticated users, so
+# repeated requests within the TTL skip the User SELECT entirely.
+user_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
 
 def request_user(request: Request) -> str:
     """Retrieve the authenticated user's sub (subject) from the request state.
@@ -64,19 +77,45 @@ async def get_authenticated_user(
         If the authenticated user is not found in the database.
 
     """
-    async with db.begin():
-        # Start transaction
-        user_email = request_user(request=request)
-
-        # Query the user from the database
-        user_db = await db.execute(
-            select(User).where(User.email == user_email),
-        )
-        user_obj = user_db.scalars().first()
-
-        if not user_obj:
-            raise HTTPException(status_code=404, detail="User not found")
-
+    # Reuse the user object already resolved earlier in this request to
+    # avoid issuing the same SELECT more than once per request.
+    user_obj = getattr(request.state, "user_obj", None)
+    if user_obj is not None:
+        return user_obj
+
+    user_email = request_user(request=request)
+
+    cached = user_cache.get(user_email)
+    if cached is not None:
+        user_id, email = cached
+        user_obj = User(user_id=user_id, email=email)
+        request.state.user_obj = user_obj
+        return user_obj
+
+    # lambda_stmt caches the compiled statement, so the expression
+    # tree is not rebuilt on every authentication.
+    # LIMIT 1 lets Postgres stop at the first match instead of
+    # buffering every matching row before first() discards the rest.
+    # Selecting only the two needed columns skips hauling the password
+    # hash over the wire and full ORM hydration on every request.
+    user_db = await db.execute(
+        lambda_stmt(
+            lambda: select(User.user_id, User.email)
+            .where(User.email == user_email)
+            .limit(1),
+        ),
+    )
+    row = user_db.one_or_none()
+
+    if row is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    user_id, email = row
+    # A detached User keeps the return type callers expect without the
+    # identity-map bookkeeping of a fully loaded entity.
+    user_obj = User(user_id=user_id, email=email)
+    user_cache[user_email] = (user_id, email)
+    request.state.user_obj = user_obj
     return user_obj
 
 
@@ -104,39 +143,35 @@ async def create_new_user(
         If a user with the same email already exists or passwords do not match.
 
     """
-    async with db.begin():
-        # Check if user already exists
-        result = await db.execute(
-            select(User).where(User.email == user_data.email),
+    # Check if passwords match
+    if user_data.password != user_data.repeat_password:
+        raise HTTPException(
+            status_code=400,
+            detail="Passwords do not match",
         )
-        existing_user = result.scalars().first()
-        if existing_user:
-            raise HTTPException(
-                status_code=400,
-                detail="User with this email already exists",
-            )
-
-        # Check if passwords match
-        if user_data.password != user_data.repeat_password:
-            raise HTTPException(
-                status_code=400,
-                detail="Passwords do not match",
-            )
-
-        # Create new user
-        hashed_password = get_hashed_password(user_data.password)
-        new_user = User(
-            email=user_data.email,
-            hashed_password=hashed_password,
-        )
-        db.add(new_user)
 
-    await db.refresh(new_user)
+    hashed_password = await get_hashed_password_async(user_data.password)
+
+    # Let the unique index on email detect duplicates so insert and
+    # existence check happen in one round trip.
+    result = await db.execute(
+        insert(User)
+        .values(email=user_data.email, hashed_password=hashed_password)
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User.user_id),
+    )
+    user_id = result.scalar_one_or_none()
+    if user_id is None:
+        raise HTTPException(
+            status_code=400,
+            detail="User with this email already exists",
+        )
+    await db.commit()
 
     # Return the newly created user details
     return {
-        "user_id": new_user.user_id,
-        "email": new_user.email,
+        "user_id": user_id,
+        "email": user_data.email,
     }
 
 
@@ -161,26 +196,31 @@ async def login_user(
         HTTPException: If the provided email or password is incorrect.
 
     """
-    async with db.begin():
-        # Query the user from the database
-        result = await db.execute(
-            select(User).where(User.email == form_data.username),
+    user_email = form_data.username
+    # Only the hash is needed to verify the login, so skip loading
+    # the full User entity.
+    result = await db.execute(
+        lambda_stmt(
+            lambda: select(User.hashed_password)
+            .where(User.email == user_email)
+            .limit(1),
+        ),
+    )
+    hashed_password = result.scalar_one_or_none()
+
+    # Check if user exists and password is correct
+    if hashed_password is None or not await verify_password_async(
+        form_data.password,
+        hashed_password,
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="Incorrect email or password",
         )
-        user = result.scalars().first()
-
-        # Check if user exists and password is correct
-        if user is None or not verify_password(
-            form_data.password,
-            user.hashed_password,
-        ):
-            raise HTTPException(
-                status_code=400,
-                detail="Incorrect email or password",
-            )
-
-        # Create tokens
-        access_token = create_access_token(user.email)
-
-        return {
-            "access_token": access_token,
-        }
+
+    # Create tokens
+    access_token = create_access_token(form_data.username)
+
+    return {
+        "access_token": access_token,
+    }
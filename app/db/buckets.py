@@ -1,20 +1,72 @@
 """Module provides functions to interact with AWS S3, including uploading,
 deleting, and downloading files.
 
-It uses the boto3 library to interface with S3 and FastAPI's UploadFile for
-handling file uploads in an asynchronous context.
+It uses the aioboto3 library to interface with S3 asynchronously and
+FastAPI's UploadFile for handling file uploads, so the event loop is
+never blocked while S3 I/O is in flight.
 """  # noqa: D205
 
 
 from __future__ import annotations
 
-import boto3
+import asyncio
+from typing import AsyncIterator
+
+import aioboto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from fastapi import UploadFile  # noqa: TCH002
 
-s3_client = boto3.client(
-    "s3",
+session = aioboto3.Session()
+
+# Keep TLS connections alive and pooled across calls so hot paths
+# don't pay a handshake per S3 operation.
+client_config = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+    s3={"addressing_style": "virtual"},
+)
+
+# Upload large files as concurrent multipart chunks instead of one
+# buffered PUT.
+transfer_config = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
 )
 
+# One client for the process lifetime: entering session.client() per
+# call rebuilt the client and its connection pool each time, so the
+# pooling and keepalive configured above never carried over between
+# operations.
+_client = None
+_client_context = None
+_client_lock = asyncio.Lock()
+
+
+async def get_s3_client():  # noqa: ANN201
+    """Return the shared S3 client, opening it on first use."""
+    global _client, _client_context  # noqa: PLW0603
+    if _client is None:
+        async with _client_lock:
+            if _client is None:
+                _client_context = session.client(
+                    "s3", config=client_config,
+                )
+                _client = await _client_context.__aenter__()
+    return _client
+
+
+async def close_s3_client() -> None:
+    """Close the shared S3 client; called from the app's lifespan."""
+    global _client, _client_context  # noqa: PLW0603
+    async with _client_lock:
+        if _client_context is not None:
+            await _client_context.__aexit__(None, None, None)
+            _client = None
+            _client_context = None
+
 
 async def upload_to_s3(
     file: UploadFile,
@@ -44,7 +96,14 @@ async def upload_to_s3(
         s3_key = file.filename
 
     try:
-        s3_client.upload_fileobj(file.file, bucket_name, s3_key)
+        # Hand the UploadFile itself to aioboto3 so each chunk is read
+        # with its async read(); aioboto3 splits the stream into
+        # concurrently uploaded parts per transfer_config instead of
+        # buffering the whole body.
+        s3_client = await get_s3_client()
+        await s3_client.upload_fileobj(
+            file, bucket_name, s3_key, Config=transfer_config,
+        )
     except:  # noqa: E722
         return None
 
@@ -69,7 +128,8 @@ async def delete_from_s3(bucket_name: str, s3_key: str) -> bool:
 
     """
     try:
-        s3_client.delete_object(Bucket=bucket_name, Key=s3_key)
+        s3_client = await get_s3_client()
+        await s3_client.delete_object(Bucket=bucket_name, Key=s3_key)
     except:  # noqa: E722
         return False
 
@@ -77,6 +137,41 @@ async def delete_from_s3(bucket_name: str, s3_key: str) -> bool:
 
 
 
+async def stream_from_s3(
+    bucket_name: str,
+    s3_key: str,
+    chunk_size: int = 64 * 1024,
+) -> AsyncIterator[bytes] | None:
+    """Stream an object from an S3 bucket in chunks.
+
+    Args:
+    ----
+        bucket_name (str): The name of the S3 bucket.
+        s3_key (str): The key of the object to stream.
+        chunk_size (int): The size of each chunk in bytes.
+
+    Returns:
+    -------
+        AsyncIterator[bytes] | None: An iterator over the object's
+        content if successful, otherwise None.
+
+    """
+    # The shared client outlives this call, so the body can keep
+    # streaming after we return the iterator.
+    s3_client = await get_s3_client()
+    try:
+        response = await s3_client.get_object(Bucket=bucket_name, Key=s3_key)
+    except:  # noqa: E722
+        return None
+
+    async def iterate_chunks() -> AsyncIterator[bytes]:
+        async for chunk in response["Body"].iter_chunks(chunk_size):
+            yield chunk
+
+    return iterate_chunks()
+
+
+
 async def download_from_s3(bucket_name: str, s3_key: str) -> bytes | None:
     """Download an object from an S3 bucket.
 
@@ -91,10 +186,12 @@ async def download_from_s3(bucket_name: str, s3_key: str) -> bytes | None:
 
     """
     try:
-        response = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-        content = response["Body"].read()
+        s3_client = await get_s3_client()
+        response = await s3_client.get_object(
+            Bucket=bucket_name, Key=s3_key,
+        )
+        content = await response["Body"].read()
     except:  # noqa: E722
         return None
 
     return content
-
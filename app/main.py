@@ -13,40 +13,58 @@ app : FastAPI
 
 from __future__ import annotations
 
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.api import api_router
+from app.core.config import settings
 from app.core.jwt import ALGORITHM, JWT_SECRET_KEY
 from app.db.base import Base
+from app.db.buckets import close_s3_client
 from app.db.session import engine
 from app.middleware.auth import JWTAuthMiddleware
 
-app = FastAPI()
 
-app.include_router(api_router, prefix="/api/v1")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: ARG001
+    """Run startup and shutdown work around the application's lifetime.
 
+    Alembic owns the schema in production; creating tables from the
+    models is opt-in for development via AUTO_CREATE_SCHEMA=1. Startup
+    also opens the pool's core connections so the first requests don't
+    pay connection setup latency.
+    """
+    if os.getenv("AUTO_CREATE_SCHEMA") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
 
+    connections = await asyncio.gather(
+        *[engine.connect() for _ in range(settings.DB_POOL_SIZE)],
+    )
+    for connection in connections:
+        await connection.close()
 
-@app.get("/")
-async def root() -> dict[str, str]:
-    """Get dict (JSON) for root path."""
-    return {"API": "Projects"}
+    yield
 
+    await close_s3_client()
+    await engine.dispose()
 
-@app.on_event("startup")
-async def on_startup() -> None:
-    """Perform actions on application startup.
 
-    This function ensures that all database tables defined in SQLAlchemy's
-    Base.metadata are created when the application starts up.
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
-    Returns
-    -------
-    None
+app.include_router(api_router, prefix="/api/v1")
 
-    """
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+
+
+@app.get("/")
+async def root() -> dict[str, str]:
+    """Get dict (JSON) for root path."""
+    return {"API": "Projects"}
 
 
 app.add_middleware(
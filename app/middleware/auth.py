@@ -1,17 +1,33 @@
 """Middleware for JWT authentication."""
 
+import asyncio
+import hashlib
 import logging
-from typing import Awaitable, Callable
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-from fastapi import Response
-from fastapi.responses import JSONResponse
-from jose import JWTError, jwt
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+import jwt
+from cachetools import TTLCache
+from fastapi.responses import ORJSONResponse
+from starlette.types import Receive, Scope, Send
 
+# Keep verified payloads for a short window so repeated requests with
+# the same token skip the HMAC check without outliving rotation.
+TOKEN_CACHE_SIZE = 10_000
+TOKEN_CACHE_TTL = 30
 
-class JWTAuthMiddleware(BaseHTTPMiddleware):
-    """Middleware for JWT authentication.
+# Below this many protected prefixes, a C-level tuple startswith beats
+# walking the segment trie.
+SMALL_ROUTE_SET = 30
+
+
+class JWTAuthMiddleware:
+    """Pure ASGI middleware for JWT authentication.
+
+    Implemented as a plain ASGI callable rather than a
+    BaseHTTPMiddleware subclass, which would spawn an extra task and
+    stream the body through a memory queue on every request.
 
     Args:
     ----
@@ -26,7 +42,25 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
 
     """
 
-    def __init__(self, app : Callable, secret_key: str, algorithm: str,    # noqa: ANN101
+    # The single instance's attributes are read on every request;
+    # slots make each of those loads a fixed offset instead of a
+    # dict probe.
+    __slots__ = (
+        "app",
+        "secret_key",
+        "key",
+        "algorithm",
+        "algorithms",
+        "protected_routes",
+        "route_trie",
+        "protected_tuple",
+        "use_tuple",
+        "executor",
+        "logger",
+        "token_cache",
+    )
+
+    def __init__(self, app, secret_key: str, algorithm: str,    # noqa: ANN101, ANN001
                  protected_routes: list ) -> None:
         """Initialize the JWTAuthMiddleware.
 
@@ -39,51 +73,127 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             that require authentication.
 
         """
-        super().__init__(app)
+        self.app = app
         self.secret_key = secret_key
+        # Hand PyJWT the key bytes directly so it doesn't re-encode
+        # the secret string on every verification.
+        self.key = secret_key.encode()
         self.algorithm = algorithm
+        # Reuse one allowed-algorithms list instead of building a
+        # fresh one per decode.
+        self.algorithms = [algorithm]
         self.protected_routes = protected_routes
+        # Match protected prefixes by walking a segment trie once per
+        # request instead of running startswith against every prefix.
+        self.route_trie: dict = {}
+        for route in protected_routes:
+            node = self.route_trie
+            for segment in route.strip("/").split("/"):
+                node = node.setdefault(segment, {})
+            node["$"] = True
+        # str.startswith against a tuple runs entirely in C, which
+        # beats the trie walk while the prefix list stays small.
+        self.protected_tuple = tuple(protected_routes)
+        self.use_tuple = len(protected_routes) <= SMALL_ROUTE_SET
+        # Signature verification is CPU work; on cache misses it runs
+        # in this pool so the event loop keeps serving other requests.
+        self.executor = ThreadPoolExecutor(max_workers=4)
         self.logger = logging.getLogger("JWTAuthMiddleware")
+        self.token_cache = TTLCache(
+            maxsize=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL,
+        )
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request],  # noqa: ANN101
-    Awaitable[Response]]) -> Response:
-        """Dispatche the request, checking for a valid JWT token of protected.
+    def _is_protected(self, path: str) -> bool:  # noqa: ANN101
+        """Return True when the path falls under a protected prefix.
 
         Args:
         ----
-            request (Request): The incoming request.
-            call_next: The next middleware or route handler.
+            path (str): The request path to classify.
 
-        Returns:
-        -------
-            Response: The response from the next middleware or route handler.
+        """
+        if self.use_tuple:
+            return path.startswith(self.protected_tuple)
+
+        node = self.route_trie
+        # Skip the empty segment before the leading slash; a terminal
+        # node only counts once the path continues past the prefix,
+        # mirroring the old startswith checks on "/..."-style prefixes.
+        for segment in path.split("/")[1:]:
+            if "$" in node:
+                return True
+            next_node = node.get(segment)
+            if next_node is None:
+                return False
+            node = next_node
+
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive,  # noqa: ANN101
+                       send: Send) -> None:
+        """Pass the request through, checking the JWT on protected routes.
 
-        Raises:
-        ------
-            HTTPException: If the token is missing or invalid.
+        Args:
+        ----
+            scope: The ASGI connection scope.
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
 
         """
-        if any(
-            request.url.path.startswith(route)
-            for route in self.protected_routes
-        ):
-            authorization: str = request.headers.get("Authorization")
-
-            if not authorization or not authorization.startswith("Bearer "):
+        # CORS preflights never carry credentials, and only http
+        # requests are classified at all.
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        if self._is_protected(scope["path"]):
+            authorization = None
+            for name, value in scope["headers"]:
+                if name == b"authorization":
+                    authorization = value.decode("latin-1")
+                    break
+
+            # A single slice comparison checks the scheme and yields
+            # the token without the extra scan and list that
+            # startswith + split cost per request.
+            if not authorization or authorization[:7] != "Bearer ":
                 self.logger.error("Missing or invalid Authorization header")
-                return JSONResponse(
+                response = ORJSONResponse(
                     content="Missing or invalid Authorization header",
                     status_code=401,
                 )
-
-            token = authorization.split(" ")[1]
-            try:
-                payload = jwt.decode(
-                    token, self.secret_key, algorithms=[self.algorithm],
-                )
-                request.state.user = payload
-            except JWTError:
-                self.logger.error("Invalid token")  # noqa: TRY400
-                return JSONResponse(content="Invalid token", status_code=401)
-
-        return await call_next(request)
+                await response(scope, receive, send)
+                return
+
+            token = authorization[7:]
+            # Key on a digest instead of the raw token so the cache
+            # never stores usable credentials.
+            cache_key = hashlib.sha256(token.encode()).hexdigest()[:32]
+            payload = self.token_cache.get(cache_key)
+            if payload is not None and payload.get("exp", 0) < time.time():
+                # A token can expire inside the cache window; never
+                # serve it past its own exp claim.
+                payload = None
+            if payload is None:
+                try:
+                    payload = await asyncio.get_running_loop().run_in_executor(
+                        self.executor,
+                        partial(
+                            jwt.decode,
+                            token,
+                            self.key,
+                            algorithms=self.algorithms,
+                        ),
+                    )
+                except jwt.PyJWTError:
+                    self.logger.error("Invalid token")  # noqa: TRY400
+                    response = ORJSONResponse(
+                        content="Invalid token", status_code=401,
+                    )
+                    await response(scope, receive, send)
+                    return
+                self.token_cache[cache_key] = payload
+            # request.state is backed by scope["state"], so handlers
+            # keep reading request.state.user as before.
+            scope.setdefault("state", {})["user"] = payload
+
+        await self.app(scope, receive, send)
@@ -1,17 +1,18 @@
 """ORM Classes for FASTapi app."""
 
-from datetime import datetime, timezone
-
 from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.db.base import Base
 
@@ -28,6 +29,10 @@ participant_project = Table(
         primary_key=True,
     ),
     Column("user_id", Integer, ForeignKey("users.user_id"), primary_key=True),
+    # The composite PK leads with project_id, so the reverse traversal
+    # needs its own index; including project_id makes user->projects
+    # lookups index-only.
+    Index("ix_participant_project_user_project", "user_id", "project_id"),
 )
 
 
@@ -50,8 +55,10 @@ class Image(Base):
     image_id = Column(Integer, primary_key=True, index=True)
     s3_key = Column(String, nullable=False, unique=True)
     image_name = Column(String, nullable=False)
+    # Filled by Postgres itself; a Python-side default would be
+    # evaluated once at import time and reused for every row.
     uploaded_at = Column(DateTime(timezone=True),
-                         default=datetime.now(timezone.utc))
+                         server_default=func.now(), nullable=False)
 
     # Relationship for the one-to-one association with project
     project = relationship("Project", back_populates="logo", uselist=False)
@@ -80,7 +87,7 @@ class Project(Base):
 
     project_id = Column(Integer, primary_key=True, index=True)
     owner_id = Column(
-        Integer, ForeignKey("users.user_id"), nullable=True,
+        Integer, ForeignKey("users.user_id"), index=True, nullable=True,
     )
     name = Column(String(255), nullable=False)
     description = Column(Text)
@@ -89,10 +96,14 @@ class Project(Base):
     )
 
     owner = relationship("User", back_populates="projects")
+    # Eager-load children by default: the async session can't lazy-load
+    # anyway, and these defaults keep project reads at a fixed query
+    # count instead of N+1.
     logo = relationship("Image", back_populates="project", uselist=False,
-                        cascade="all")
+                        cascade="all", lazy="joined")
     documents = relationship(
         "Document", back_populates="project", cascade="all, delete-orphan",
+        lazy="selectin",
     )
     participants = relationship(
         "User", secondary="participant_project", back_populates="projects",
@@ -116,7 +127,7 @@ class User(Base):
     __tablename__ = "users"
 
     user_id = Column(Integer, primary_key=True, index=True)
-    email = Column(String(255), nullable=False, unique=True)
+    email = Column(String(255), nullable=False, unique=True, index=True)
     hashed_password = Column(Text, nullable=False)
 
     # Relationship for the many-to-many association with projects
@@ -140,13 +151,22 @@ class Document(Base):
     """
 
     __tablename__ = "documents"
+    # Duplicate names inside a project are rejected by the database
+    # itself, so callers don't need a pre-insert existence check.
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id", "document_name", name="uq_document_project_name",
+        ),
+    )
 
     document_id = Column(Integer, primary_key=True, index=True)
     document_name = Column(String(255), nullable=False)
     s3_key = Column(String(255), nullable=False)
-    project_id = Column(Integer, ForeignKey("projects.project_id"))
+    project_id = Column(
+        Integer, ForeignKey("projects.project_id"), index=True,
+    )
     uploaded_at = Column(DateTime(timezone=True),
-                         default=datetime.now(timezone.utc))
+                         server_default=func.now(), nullable=False)
     # Relationship for the one-to-many association with project
     project = relationship("Project", back_populates="documents")
 
@@ -1,45 +1,21 @@
 """Document schemas."""
 
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class DocumentOut(BaseModel):
     """Model representing document details."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     document_id : int
     document_name: str
 
-    class Config:
-        """Configuration for Pydantic model to support ORM mode.
-
-        Attributes
-        ----------
-        orm_mode : bool
-            If set to True, enables Pydantic to work with ORM models
-            (e.g., SQLAlchemy models), allowing automatic conversion
-            from ORM instances to Pydantic models.
-
-        """
-
-        orm_mode = True
-
 
 class DocumentName(BaseModel):
     """Model representing document details."""
 
-    document_name: str
-
-    class Config:
-        """Configuration for Pydantic model to support ORM mode.
-
-        Attributes
-        ----------
-        orm_mode : bool
-            If set to True, enables Pydantic to work with ORM models
-            (e.g., SQLAlchemy models), allowing automatic conversion
-            from ORM instances to Pydantic models.
+    model_config = ConfigDict(from_attributes=True)
 
-        """
-
-        orm_mode = True
+    document_name: str
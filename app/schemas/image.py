@@ -1,23 +1,11 @@
 """Image schemas."""
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class LogoOut(BaseModel):
     """Model representing document details."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     image_id: int
     image_name: str
-
-    class Config:
-        """Configuration for Pydantic model to support ORM mode.
-
-        Attributes
-        ----------
-        orm_mode : bool
-            If set to True, enables Pydantic to work with ORM models
-            (e.g., SQLAlchemy models), allowing automatic conversion
-            from ORM instances to Pydantic models.
-
-        """
-
-        orm_mode = True
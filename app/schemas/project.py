@@ -1,11 +1,9 @@
 """Project schemas."""
 from __future__ import annotations
 
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-from pydantic import BaseModel
-
-from app.schemas.document import DocumentOut  # noqa: TCH001
+from app.schemas.document import DocumentOut
 
 
 class ProjectBase(BaseModel):
@@ -20,44 +18,28 @@ class ProjectBase(BaseModel):
 
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     name: str
     description: str
 
-    class Config:
-        """Configuration for Pydantic BaseModel.
-
-        orm_mode (bool): Whether to interpret and return all
-        fields in ORM mode, which allows accessing model attributes
-        and database columns directly.
-        """
-
-        orm_mode = True
-
 
 class ProjectBaseUpdate(BaseModel):
     """Model for updating project data.
 
     Attributes
     ----------
-    name : Optional[str], optional
+    name : str | None, optional
         The new name of the project, by default None.
-    description : Optional[str], optional
+    description : str | None, optional
         The new description of the project, by default None.
 
     """
 
-    name: Optional[str] = None  # noqa: UP007
-    description: Optional[str] = None  # noqa: UP007
+    model_config = ConfigDict(from_attributes=True)
 
-    class Config:
-        """Configuration for Pydantic BaseModel.
-
-        orm_mode (bool): Whether to interpret and return all
-        fields in ORM mode, which allows accessing model attributes
-        and database columns directly.
-        """
-
-        orm_mode = True
+    name: str | None = None
+    description: str | None = None
 
 
 class ProjectOut(BaseModel):
@@ -73,26 +55,18 @@ class ProjectOut(BaseModel):
         The description of the project.
     owner_id : int
         The identifier of the project owner.
-    logo_id : Optional[int], optional
+    logo_id : int | None, optional
         The identifier of the project's logo, if any.
 
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     project_id: int
     name: str
     description: str
     owner_id: int
-    logo_id: Optional[int]  # noqa: UP007
-
-    class Config:
-        """Configuration for Pydantic BaseModel.
-
-        orm_mode (bool): Whether to interpret and return all
-        fields in ORM mode, which allows accessing model attributes
-        and database columns directly.
-        """
-
-        orm_mode = True
+    logo_id: int | None
 
 
 class ProjectOutWithDocuments(BaseModel):
@@ -108,30 +82,22 @@ class ProjectOutWithDocuments(BaseModel):
         The name of the project.
     description : str
         The description of the project.
-    logo_id : Optional[int], optional
+    logo_id : int | None, optional
         The identifier of the project's logo, if any.
     documents : List[DocumentOut], optional
         List of documents associated with the project.
 
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     project_id: int
     owner_id: int
     name: str
     description: str
-    logo_id: Optional[int]    # noqa: UP007
+    logo_id: int | None
     documents: list[DocumentOut] = []
 
-    class Config:
-        """Configuration for Pydantic BaseModel.
-
-        orm_mode (bool): Whether to interpret and return all
-        fields in ORM mode, which allows accessing model attributes
-        and database columns directly.
-        """
-
-        orm_mode = True
-
 
 class ResponseMessage(BaseModel):
     """Model for response messages.
@@ -144,3 +110,10 @@ class ResponseMessage(BaseModel):
     """
 
     message: str
+
+
+# Validate whole result lists in one pydantic-core pass instead of one
+# model instance at a time.
+PROJECTS_ADAPTER = TypeAdapter(list[ProjectOut])
+PROJECTS_WITH_DOCUMENTS_ADAPTER = TypeAdapter(list[ProjectOutWithDocuments])
+DOCUMENTS_ADAPTER = TypeAdapter(list[DocumentOut])
@@ -3,14 +3,17 @@ These tests cover the functionality of uploading, downloading,
 and deleting project documents.
 """  # noqa: D205
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from fastapi import UploadFile
 from httpx import AsyncClient
 
 BASE_URL = "/api/v1/document"
 
+# Plain (filename, content, content_type) tuple; no mocked UploadFile
+# ceremony needed just to feed httpx a multipart part.
+PDF_FILE = ("document.pdf", b"document_content", "application/pdf")
+
 
 @pytest.mark.asyncio()
 async def test_upload_project_document(
@@ -30,11 +33,8 @@ async def test_upload_project_document(
         int: The ID of the uploaded document.
 
     """
-    user, project, image, password, access_token, document = create_objects
-    mock_file = MagicMock(spec=UploadFile)
-    mock_file.filename = "document.pdf"
-    mock_file.read = AsyncMock(return_value=b"document_content")
-    mock_file.content_type = "application/pdf"
+    document = create_objects.document
+    access_token = create_objects.access_token
 
     with patch(
         "app.crud.document.upload_to_s3",
@@ -42,13 +42,7 @@ async def test_upload_project_document(
     ):
         response = await async_client.put(
             f"{BASE_URL}/{document.document_id}",
-            files={
-                "file": (
-                    mock_file.filename,
-                    await mock_file.read(),
-                    mock_file.content_type,
-                ),
-            },
+            files={"file": PDF_FILE},
             headers={"Authorization": f"Bearer {access_token}"},
         )
         assert response.status_code == 200  # noqa: S101, PLR2004
@@ -68,11 +62,12 @@ async def test_download_project_document(
         password, access token, and document.
 
     """
-    user, project, image, password, access_token, document = create_objects
+    document = create_objects.document
+    access_token = create_objects.access_token
 
     with patch(
-        "app.crud.document.download_from_s3",
-        new=AsyncMock(return_value=b"document_content"),
+        "app.crud.document.stream_from_s3",
+        new=AsyncMock(return_value=iter([b"document_content"])),
     ):
         response = await async_client.get(
             f"{BASE_URL}/{document.document_id}",
@@ -96,7 +91,8 @@ async def test_delete_project_document(
         password, access token, and document.
 
     """
-    user, project, image, password, access_token, document = create_objects
+    document = create_objects.document
+    access_token = create_objects.access_token
 
     with patch(
         "app.crud.document.delete_from_s3", new=AsyncMock(return_value=True),
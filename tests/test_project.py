@@ -5,18 +5,28 @@ as well as creating, reading, updating, and deleting projects and
 inviting users to projects.
 """  # noqa: D205
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from __future__ import annotations
 
 import pytest
-from fastapi import UploadFile
-from httpx import AsyncClient
+from httpx import AsyncClient  # noqa: TCH002
 
 BASE_URL = "/api/v1/project"
 
+# Plain (filename, content, content_type) tuples are all httpx needs;
+# a mocked UploadFile adds Mock machinery without testing anything.
+# The endpoint accepts multiple files, so the upload case exercises
+# the whole per-file loop in one request.
+DOC_BATCH = [
+    ("files", ("doc1.txt", b"a", "text/plain")),
+    ("files", ("doc2.txt", b"b", "text/plain")),
+    ("files", ("doc3.txt", b"c", "text/plain")),
+]
+LOGO_FILE = ("logo_image.png", b"image_content", "image/png")
+
 
 @pytest.mark.asyncio()
 async def test_delete_project(
-    async_client: AsyncClient, create_objects,  # noqa: ANN001
+    async_client: AsyncClient, create_objects, auth_headers: dict,  # noqa: ANN001
 ) -> None:
     """Test the deletion of a project.
 
@@ -25,13 +35,14 @@ async def test_delete_project(
         async_client (AsyncClient): The HTTP client for making API requests.
         create_objects (tuple): Fixture that provides user, project, image,
         password, access token, and document.
+        auth_headers (dict): Authorization headers for the fixture user.
 
     """
-    user, project, image, password, access_token, document = create_objects
+    project = create_objects.project
 
     delete_response = await async_client.delete(
         f"{BASE_URL}/{project.project_id}",
-        headers={"Authorization": f"Bearer {access_token}"},
+        headers=auth_headers,
     )
     assert delete_response.status_code == 200  # noqa: S101, PLR2004
     assert delete_response.json() == {  # noqa: S101
@@ -40,7 +51,9 @@ async def test_delete_project(
 
 
 @pytest.mark.asyncio()
-async def test_read_project(async_client: AsyncClient, create_objects) -> None:  # noqa: ANN001
+async def test_read_project(
+    async_client: AsyncClient, create_objects, auth_headers: dict,  # noqa: ANN001
+) -> None:
     """Test reading project details.
 
     Args:
@@ -48,24 +61,28 @@ async def test_read_project(async_client: AsyncClient, create_objects) -> None:
         async_client (AsyncClient): The HTTP client for making API requests.
         create_objects (tuple): Fixture that provides user, project, image,
         password, access token, and document.
+        auth_headers (dict): Authorization headers for the fixture user.
 
     """
-    user, project, image, password, access_token, document = create_objects
+    project = create_objects.project
 
     response = await async_client.get(
         f"{BASE_URL}/{project.project_id}/info",
-        headers={"Authorization": f"Bearer {access_token}"},
+        headers=auth_headers,
     )
 
     assert response.status_code == 200  # noqa: S101, PLR2004
-    assert "name" in response.json()  # noqa: S101
-    assert response.json()["name"] == "Test Project"  # noqa: S101
+    # httpx re-parses the body on every .json() call; parse once.
+    body = response.json()
+    assert "name" in body  # noqa: S101
+    assert body["name"] == "Test Project"  # noqa: S101
 
 
 @pytest.mark.asyncio()
 async def test_update_existing_project(
     async_client: AsyncClient,
     create_objects,  # noqa: ANN001
+    auth_headers: dict,
 ) -> None:
     """Test updating an existing project.
 
@@ -74,9 +91,10 @@ async def test_update_existing_project(
         async_client (AsyncClient): The HTTP client for making API requests.
         create_objects (tuple): Fixture that provides user, project, image,
         password, access token, and document.
+        auth_headers (dict): Authorization headers for the fixture user.
 
     """
-    user, project, image, password, access_token, document = create_objects
+    project = create_objects.project
 
     updated_project_data = {
         "name": "Updated Project",
@@ -86,7 +104,7 @@ async def test_update_existing_project(
     response = await async_client.put(
         f"{BASE_URL}/{project.project_id}/info",
         json=updated_project_data,
-        headers={"Authorization": f"Bearer {access_token}"},
+        headers=auth_headers,
     )
 
     assert response.status_code == 200  # noqa: S101, PLR2004
@@ -98,6 +116,7 @@ async def test_invite_user_to_project(
     async_client: AsyncClient,
     create_objects,  # noqa: ANN001
     create_user_fixture,  # noqa: ANN001
+    auth_headers: dict,
 ) -> None:
     """Test inviting a user to a project.
 
@@ -107,15 +126,16 @@ async def test_invite_user_to_project(
         create_objects (tuple): Fixture that provides user, project, image,
         password, access token, and document.
         create_user_fixture (tuple): Fixture that provides a user and password.
+        auth_headers (dict): Authorization headers for the fixture user.
 
     """
-    user, project, image, password, access_token, document = create_objects
+    project = create_objects.project
     user, _ = create_user_fixture
 
     invite_response = await async_client.post(
         f"{BASE_URL}/{project.project_id}/invite",
         params={"user_email": user.email},
-        headers={"Authorization": f"Bearer {access_token}"},
+        headers=auth_headers,
     )
 
     assert invite_response.status_code == 200  # noqa: S101, PLR2004
@@ -125,51 +145,72 @@ async def test_invite_user_to_project(
 
 
 @pytest.mark.asyncio()
-async def test_upload_project_documents(
+@pytest.mark.parametrize(
+    ("method", "suffix", "files", "json_key", "expected"),
+    [
+        ("post", "/documents", DOC_BATCH, "document_name", "doc1.txt"),
+        ("put", "/logo", {"file": LOGO_FILE}, "image_name", "logo_image.png"),
+        ("get", "/logo", None, None, b"logo_content"),
+        ("delete", "/logo", None, "message", "Logo deleted successfully"),
+    ],
+    ids=["upload-documents", "upload-logo", "get-logo", "delete-logo"],
+)
+async def test_project_media_endpoints(  # noqa: PLR0913
     async_client: AsyncClient,
     create_objects,  # noqa: ANN001
+    auth_headers: dict,
+    method: str,
+    suffix: str,
+    files: dict | list | None,
+    json_key: str | None,
+    expected: object,
 ) -> None:
-    """Test uploading documents to a project.
+    """Test the document and logo endpoints table-driven.
+
+    The four S3-backed endpoints share the same scaffolding — token
+    from the fixture, one request, one field assertion — so one
+    parametrized test covers upload/download/delete of media.
 
     Args:
     ----
         async_client (AsyncClient): The HTTP client for making API requests.
         create_objects (tuple): Fixture that provides user, project, image,
         password, access token, and document.
+        auth_headers (dict): Authorization headers for the fixture user.
+        method (str): HTTP method to call.
+        suffix (str): Path under the project to request.
+        files (dict | list | None): Multipart payload, when the
+        endpoint uploads.
+        json_key (str | None): JSON field to assert on, or None to
+        compare the raw body.
+        expected (object): Expected field value or raw body.
 
     """
-    user, project, image, password, access_token, document = create_objects
-
-    mock_file = MagicMock(spec=UploadFile)
-    mock_file.filename = "test_document.txt"
-    mock_file.read = AsyncMock(return_value=b"file_content")
-    mock_file.content_type = "text/plain"
-
-    with patch(
-        "app.crud.project.upload_to_s3",
-        new=AsyncMock(return_value="mock_s3_key"),
-    ):
-        upload_response = await async_client.post(
-            f"{BASE_URL}/{project.project_id}/documents",
-            files={
-                "files": (
-                    mock_file.filename,
-                    await mock_file.read(),
-                    mock_file.content_type,
-                ),
-            },
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-
-    assert upload_response.status_code == 200  # noqa: S101, PLR2004
-    assert isinstance(upload_response.json(), list)  # noqa: S101
-    assert upload_response.json()[0]["document_name"] == "test_document.txt"  # noqa: S101
+    project = create_objects.project
+
+    kwargs = {"headers": auth_headers}
+    if files is not None:
+        kwargs["files"] = files
+    response = await getattr(async_client, method)(
+        f"{BASE_URL}/{project.project_id}{suffix}", **kwargs,
+    )
+
+    assert response.status_code == 200  # noqa: S101, PLR2004
+    if json_key is None:
+        assert response.content == expected  # noqa: S101
+    else:
+        body = response.json()
+        if isinstance(body, list):
+            assert len(body) == len(files)  # noqa: S101
+            body = body[0]
+        assert body[json_key] == expected  # noqa: S101
 
 
 @pytest.mark.asyncio()
 async def test_get_project_documents(
     async_client: AsyncClient,
     create_objects,  # noqa: ANN001
+    auth_headers: dict,
 ) -> None:
     """Test retrieving documents for a project.
 
@@ -178,14 +219,14 @@ async def test_get_project_documents(
         async_client (AsyncClient): The HTTP client for making API requests.
         create_objects (tuple): Fixture that provides user, project, image,
         password, access token, and document.
+        auth_headers (dict): Authorization headers for the fixture user.
 
     """
-    user, project, image, password, access_token, document = create_objects
+    project = create_objects.project
 
-    headers = {"Authorization": f"Bearer {access_token}"}
     response = await async_client.get(
         f"{BASE_URL}/{project.project_id}/documents",
-        headers=headers,
+        headers=auth_headers,
     )
 
     assert response.status_code == 200  # noqa: S101, PLR2004
@@ -193,98 +234,3 @@ async def test_get_project_documents(
     assert isinstance(documents, list)  # noqa: S101
 
 
-@pytest.mark.asyncio()
-async def test_get_project_logo(
-    async_client: AsyncClient,
-    create_objects,  # noqa: ANN001
-) -> None:
-    """Test retrieving the logo for a project.
-
-    Args:
-    ----
-        async_client (AsyncClient): The HTTP client for making API requests.
-        create_objects (tuple): Fixture that provides user, project, image,
-        password, access token, and document.
-
-    """
-    user, project, image, password, access_token, document = create_objects
-
-    with patch(
-        "app.crud.project.download_from_s3",
-        new=AsyncMock(return_value=b"logo_content"),
-    ):
-        get_logo_response = await async_client.get(
-            f"{BASE_URL}/{project.project_id}/logo",
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-
-    assert get_logo_response.status_code == 200  # noqa: S101, PLR2004
-    assert get_logo_response.content == b"logo_content"  # noqa: S101
-
-
-@pytest.mark.asyncio()
-async def test_upload_project_logo(
-    async_client: AsyncClient,
-    create_objects,  # noqa: ANN001
-) -> None:
-    """Test uploading a logo to a project.
-
-    Args:
-    ----
-        async_client (AsyncClient): The HTTP client for making API requests.
-        create_objects (tuple): Fixture that provides user, project, image,
-        password, access token, and document.
-
-    """
-    user, project, image, password, access_token, document = create_objects
-
-    mock_file = MagicMock(spec=UploadFile)
-    mock_file.filename = "logo_image.png"
-    mock_file.read = AsyncMock(return_value=b"image_content")
-    mock_file.content_type = "image/png"
-
-    with patch(
-        "app.crud.project.upload_to_s3",
-        new=AsyncMock(return_value="mock_s3_key_6"),
-    ):
-        upload_response = await async_client.put(
-            f"{BASE_URL}/{project.project_id}/logo",
-            files={
-                "file": (
-                    mock_file.filename,
-                    await mock_file.read(),
-                    mock_file.content_type,
-                ),
-            },
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-
-    assert upload_response.status_code == 200  # noqa: S101, PLR2004
-    assert upload_response.json()["image_name"] == "logo_image.png"  # noqa: S101
-
-
-@pytest.mark.asyncio()
-async def test_delete_project_logo(
-    async_client: AsyncClient, create_objects,  # noqa: ANN001
-) -> None:
-    """Test deleting a project's logo.
-
-    Args:
-    ----
-        async_client (AsyncClient): The HTTP client for making API requests.
-        create_objects (tuple): Fixture that provides user, project, image,
-          password, access token, and document.
-
-    """
-    user, project, image, password, access_token, document = create_objects
-
-    with patch(
-        "app.crud.project.delete_from_s3", new=AsyncMock(return_value=True),
-    ):
-        delete_response = await async_client.delete(
-            f"{BASE_URL}/{project.project_id}/logo",
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-
-    assert delete_response.status_code == 200  # noqa: S101, PLR2004
-    assert delete_response.json()["message"] == "Logo deleted successfully"  # noqa: S101
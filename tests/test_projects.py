@@ -9,30 +9,27 @@ BASE_URL = "/api/v1/projects/"
 
 
 @pytest.mark.asyncio()
-async def test_add_project(async_client: AsyncClient, create_objects) -> None:  # noqa: ANN001
+@pytest.mark.usefixtures("create_objects")
+async def test_add_project(
+    async_client: AsyncClient, auth_headers: dict,
+) -> None:
     """Test adding a new project.
 
     Args:
     ----
         async_client (AsyncClient): The HTTP client for making API requests.
-        create_objects (tuple): Fixture that provides user, project, image,
-        password, access token, and document.
+        auth_headers (dict): Authorization headers for the fixture user.
 
     """
-    user, project, image, password, access_token, document = create_objects
-
     project_data = {
         "name": "Test Project",
         "description": "Test Project Description",
     }
-    headers = {}
-    if access_token:
-        headers["Authorization"] = f"Bearer {access_token}"
 
     response = await async_client.post(
         BASE_URL,
         json=project_data,
-        headers=headers,
+        headers=auth_headers,
     )
 
     assert response.status_code == 200  # noqa: S101, PLR2004
@@ -40,21 +37,21 @@ async def test_add_project(async_client: AsyncClient, create_objects) -> None:
 
 
 @pytest.mark.asyncio()
-async def test_get_projects(async_client: AsyncClient, create_objects) -> None:  # noqa: ANN001
+@pytest.mark.usefixtures("create_objects")
+async def test_get_projects(
+    async_client: AsyncClient, auth_headers: dict,
+) -> None:
     """Test retrieving a list of projects.
 
     Args:
     ----
         async_client (AsyncClient): The HTTP client for making API requests.
-        create_objects (tuple): Fixture that provides user, project, image,
-        password, access token, and document.
+        auth_headers (dict): Authorization headers for the fixture user.
 
     """
-    user, project, image, password, access_token, document = create_objects
-
     response = await async_client.get(
         BASE_URL,
-        headers={"Authorization": f"Bearer {access_token}"},
+        headers=auth_headers,
     )
     assert response.status_code == 200  # noqa: S101, PLR2004
     assert isinstance(response.json(), list)  # noqa: S101